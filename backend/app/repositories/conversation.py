@@ -1,3 +1,4 @@
+import io
 import json
 import logging
 import os
@@ -23,6 +24,7 @@ from app.repositories.models.conversation import (
     ToolResultModel,
 )
 from boto3.dynamodb.conditions import Key
+from boto3.s3.transfer import TransferConfig
 from botocore.exceptions import ClientError
 from pydantic import TypeAdapter
 
@@ -30,6 +32,9 @@ logger = logging.getLogger(__name__)
 logger.setLevel(logging.INFO)
 
 THRESHOLD_LARGE_MESSAGE = 300 * 1024  # 300KB
+# Message maps above this size are uploaded with the managed transfer, which
+# splits them into parallel multipart uploads.
+THRESHOLD_MULTIPART_UPLOAD = TransferConfig().multipart_threshold
 LARGE_MESSAGE_BUCKET = os.environ.get("LARGE_MESSAGE_BUCKET")
 
 BEDROCK_REGION = os.environ.get("BEDROCK_REGION", "us-east-1")
@@ -39,7 +44,11 @@ s3_client = boto3.client("s3", BEDROCK_REGION)
 def store_conversation(
     user_id: str, conversation: ConversationModel, threshold=THRESHOLD_LARGE_MESSAGE
 ):
-    logger.info(f"Storing conversation: {conversation.model_dump_json()}")
+    logger.info(f"Storing conversation: {conversation.id}")
+    # The full dump includes every message and attachment, so only build it
+    # when it will actually be logged.
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug(f"Conversation: {conversation.model_dump_json()}")
     table = get_conversation_table_client(user_id)
 
     item_params = {
@@ -60,7 +69,12 @@ def store_conversation(
     message_map = {
         k: v.model_dump(by_alias=True) for k, v in conversation.message_map.items()
     }
-    message_map_size = len(json.dumps(message_map).encode("utf-8"))
+    # Serialize once and reuse it for both the size check and the write.
+    # Tool inputs and results are arbitrary JSON values that may hold integers
+    # wider than 64 bits or NaN, so this stays on the stdlib json encoder.
+    message_map_json = json.dumps(message_map)
+    message_map_bytes = message_map_json.encode("utf-8")
+    message_map_size = len(message_map_bytes)
     logger.info(f"Message map size: {message_map_size}")
     if message_map_size > threshold:
         logger.info(
@@ -70,18 +84,25 @@ def store_conversation(
         large_message_path = f"{user_id}/{conversation.id}/message_map.json"
         item_params["LargeMessagePath"] = large_message_path
         # Store all message in S3
-        s3_client.put_object(
-            Bucket=LARGE_MESSAGE_BUCKET,
-            Key=large_message_path,
-            Body=json.dumps(message_map),
-        )
+        if message_map_size > THRESHOLD_MULTIPART_UPLOAD:
+            s3_client.upload_fileobj(
+                io.BytesIO(message_map_bytes),
+                LARGE_MESSAGE_BUCKET,
+                large_message_path,
+            )
+        else:
+            s3_client.put_object(
+                Bucket=LARGE_MESSAGE_BUCKET,
+                Key=large_message_path,
+                Body=message_map_bytes,
+            )
         # Store only `system` attribute in DynamoDB
         item_params["MessageMap"] = json.dumps(
             {k: v for k, v in message_map.items() if k == "system"}
         )
     else:
         item_params["IsLargeMessage"] = False
-        item_params["MessageMap"] = json.dumps(message_map)
+        item_params["MessageMap"] = message_map_json
 
     response = table.put_item(
         Item=item_params,
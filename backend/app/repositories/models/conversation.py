@@ -4,7 +4,7 @@ import json
 import logging
 import re
 from pathlib import Path
-from typing import TYPE_CHECKING, Annotated, Any, Literal, Self, TypeGuard
+from typing import TYPE_CHECKING, Annotated, Any, Callable, Literal, Self, TypeGuard
 from urllib.parse import urlparse
 
 from app.repositories.common import decompose_conv_id
@@ -14,6 +14,8 @@ from app.routes.schemas.conversation import (
     Content,
     DocumentToolResult,
     ImageContent,
+    ImageGenerationRequestContent,
+    ImageGenerationResponseContent,
     ImageToolResult,
     JsonToolResult,
     MessageInput,
@@ -27,6 +29,8 @@ from app.routes.schemas.conversation import (
     ToolResultContentBody,
     ToolUseContent,
     ToolUseContentBody,
+    VideoGenerationRequestContent,
+    VideoGenerationResponseContent,
     type_model_name,
 )
 from app.utils import generate_presigned_url
@@ -601,8 +605,21 @@ class ImageGenerationRequestContentModel(BaseModel):
     cfg_scale: float = 7.0
     seed: int | None = None
 
+    @classmethod
+    def from_image_generation_request_content(
+        cls, content: ImageGenerationRequestContent
+    ) -> Self:
+        return cls(
+            content_type="image_generation_request",
+            prompt=content.prompt,
+            negative_prompt=content.negative_prompt,
+            width=content.width,
+            height=content.height,
+            cfg_scale=content.cfg_scale,
+            seed=content.seed,
+        )
+
     def to_content(self) -> Content:
-        from app.routes.schemas.conversation import ImageGenerationRequestContent
         return ImageGenerationRequestContent(
             content_type="image_generation_request",
             prompt=self.prompt,
@@ -625,8 +642,19 @@ class ImageGenerationResponseContentModel(BaseModel):
     prompt: str
     seed: int | None = None
 
+    @classmethod
+    def from_image_generation_response_content(
+        cls, content: ImageGenerationResponseContent
+    ) -> Self:
+        return cls(
+            content_type="image_generation_response",
+            image_data=content.image_data,
+            media_type=content.media_type,
+            prompt=content.prompt,
+            seed=content.seed,
+        )
+
     def to_content(self) -> Content:
-        from app.routes.schemas.conversation import ImageGenerationResponseContent
         return ImageGenerationResponseContent(
             content_type="image_generation_response",
             image_data=self.image_data,
@@ -648,8 +676,20 @@ class VideoGenerationRequestContentModel(BaseModel):
     fps: int = 24
     seed: int | None = None
 
+    @classmethod
+    def from_video_generation_request_content(
+        cls, content: VideoGenerationRequestContent
+    ) -> Self:
+        return cls(
+            content_type="video_generation_request",
+            prompt=content.prompt,
+            negative_prompt=content.negative_prompt,
+            duration_seconds=content.duration_seconds,
+            fps=content.fps,
+            seed=content.seed,
+        )
+
     def to_content(self) -> Content:
-        from app.routes.schemas.conversation import VideoGenerationRequestContent
         return VideoGenerationRequestContent(
             content_type="video_generation_request",
             prompt=self.prompt,
@@ -672,8 +712,20 @@ class VideoGenerationResponseContentModel(BaseModel):
     duration_seconds: int
     seed: int | None = None
 
+    @classmethod
+    def from_video_generation_response_content(
+        cls, content: VideoGenerationResponseContent
+    ) -> Self:
+        return cls(
+            content_type="video_generation_response",
+            video_data=content.video_data,
+            media_type=content.media_type,
+            prompt=content.prompt,
+            duration_seconds=content.duration_seconds,
+            seed=content.seed,
+        )
+
     def to_content(self) -> Content:
-        from app.routes.schemas.conversation import VideoGenerationResponseContent
         return VideoGenerationResponseContent(
             content_type="video_generation_response",
             video_data=self.video_data,
@@ -703,72 +755,28 @@ ContentModel = Annotated[
 ]
 
 
-def content_model_from_content(content: Content) -> ContentModel:
-    from app.routes.schemas.conversation import (
-        ImageGenerationRequestContent,
-        ImageGenerationResponseContent,
-        VideoGenerationRequestContent,
-        VideoGenerationResponseContent,
-    )
-
-    if isinstance(content, TextContent):
-        return TextContentModel.from_text_content(content=content)
-
-    elif isinstance(content, ImageContent):
-        return ImageContentModel.from_image_content(content=content)
-
-    elif isinstance(content, AttachmentContent):
-        return AttachmentContentModel.from_attachment_content(content=content)
-
-    elif isinstance(content, ToolUseContent):
-        return ToolUseContentModel.from_tool_use_content(content=content)
-
-    elif isinstance(content, ToolResultContent):
-        return ToolResultContentModel.from_tool_result_content(content=content)
-
-    elif isinstance(content, ImageGenerationRequestContent):
-        return ImageGenerationRequestContentModel(
-            content_type="image_generation_request",
-            prompt=content.prompt,
-            negative_prompt=content.negative_prompt,
-            width=content.width,
-            height=content.height,
-            cfg_scale=content.cfg_scale,
-            seed=content.seed,
-        )
-
-    elif isinstance(content, ImageGenerationResponseContent):
-        return ImageGenerationResponseContentModel(
-            content_type="image_generation_response",
-            image_data=content.image_data,
-            media_type=content.media_type,
-            prompt=content.prompt,
-            seed=content.seed,
-        )
-
-    elif isinstance(content, VideoGenerationRequestContent):
-        return VideoGenerationRequestContentModel(
-            content_type="video_generation_request",
-            prompt=content.prompt,
-            negative_prompt=content.negative_prompt,
-            duration_seconds=content.duration_seconds,
-            fps=content.fps,
-            seed=content.seed,
-        )
+# Keyed on the `content_type` discriminator of `Content`, so that converting a
+# message does not walk an isinstance chain for every content block.
+_CONTENT_MODEL_FACTORIES: dict[str, Callable[[Any], ContentModel]] = {
+    "text": TextContentModel.from_text_content,
+    "image": ImageContentModel.from_image_content,
+    "attachment": AttachmentContentModel.from_attachment_content,
+    "toolUse": ToolUseContentModel.from_tool_use_content,
+    "toolResult": ToolResultContentModel.from_tool_result_content,
+    "image_generation_request": ImageGenerationRequestContentModel.from_image_generation_request_content,
+    "image_generation_response": ImageGenerationResponseContentModel.from_image_generation_response_content,
+    "video_generation_request": VideoGenerationRequestContentModel.from_video_generation_request_content,
+    "video_generation_response": VideoGenerationResponseContentModel.from_video_generation_response_content,
+}
 
-    elif isinstance(content, VideoGenerationResponseContent):
-        return VideoGenerationResponseContentModel(
-            content_type="video_generation_response",
-            video_data=content.video_data,
-            media_type=content.media_type,
-            prompt=content.prompt,
-            duration_seconds=content.duration_seconds,
-            seed=content.seed,
-        )
 
-    else:
+def content_model_from_content(content: Content) -> ContentModel:
+    factory = _CONTENT_MODEL_FACTORIES.get(content.content_type)
+    if factory is None:
         raise ValueError(f"Unknown content type: {type(content)}")
 
+    return factory(content)
+
 
 class SimpleMessageModel(BaseModel):
     role: str
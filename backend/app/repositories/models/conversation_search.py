@@ -40,10 +40,10 @@ class ConversationSearchModel(BaseModel):
         last_updated_time = 0.0
 
         # 1. Try to get from the latest message's create_time
-        if source.get("messages") and isinstance(source.get("messages"), list):
-            messages = source.get("messages", [])
+        messages = source.get("messages")
+        if messages and isinstance(messages, list):
             message_times = [
-                msg.get("value", {}).get("create_time", 0)
+                msg["value"].get("create_time", 0)
                 for msg in messages
                 if isinstance(msg.get("value"), dict)
             ]
@@ -12,6 +12,7 @@ from app.repositories.common import get_bot_table_client
 from app.repositories.models.custom_bot import BotMetaWithStackInfo
 from app.repositories.models.usage_analysis import UsagePerBot, UsagePerUser
 from boto3.dynamodb.conditions import Attr, Key
+from botocore.config import Config
 
 REGION = os.environ.get("REGION", "us-east-1")
 USAGE_ANALYSIS_DATABASE = os.environ.get(
@@ -26,10 +27,25 @@ USAGE_ANALYSIS_OUTPUT_LOCATION = os.environ.get(
 )
 USER_POOL_ID = os.environ.get("USER_POOL_ID", "us-east-1_XXXXXXXXX")
 QUERY_LIMIT = 1000
+# Interval between Athena status checks, doubled after each check up to the max
+INITIAL_POLL_INTERVAL = 0.5
+MAX_POLL_INTERVAL = 5.0
+# The API is served through API Gateway, whose integration timeout is 30 seconds,
+# so there is no point in waiting for a query any longer than that.
+QUERY_TIMEOUT = 30.0
 
 
 logger = logging.getLogger(__name__)
-athena = boto3.client("athena")
+# Individual Athena API calls return quickly, so keep the client timeouts well
+# inside QUERY_TIMEOUT; run_athena_query enforces the overall deadline.
+athena = boto3.client(
+    "athena",
+    config=Config(
+        connect_timeout=5,
+        read_timeout=10,
+        retries={"mode": "adaptive", "max_attempts": 3},
+    ),
+)
 
 
 def _find_cognito_user_by_id(user_id: str) -> dict | None:
@@ -62,7 +78,7 @@ async def _find_cognito_users_by_ids(user_ids: list[str]) -> list[dict]:
     return [result for result in results if result is not None]
 
 
-async def _query_bot_by_id(bot_id: str) -> list[dict]:
+def _query_bot_by_id(bot_id: str) -> list[dict]:
     """Query DynamoDB to find a public bot by bot_id."""
     table = get_bot_table_client()
     response = table.query(
@@ -83,8 +99,7 @@ async def _find_bots_by_ids(bot_ids: list[str]) -> dict[str, BotMetaWithStackInf
     results = await asyncio.gather(*tasks)
 
     bots_dict = {}
-    for items_result in results:
-        items = await items_result  # Await the coroutine to get the actual items
+    for items in results:
         for item in items:
             bot_obj = BotMetaWithStackInfo(
                 id=item["BotId"],
@@ -104,44 +119,107 @@ async def _find_bots_by_ids(bot_ids: list[str]) -> dict[str, BotMetaWithStackInf
     return bots_dict
 
 
+async def _call_athena(deadline: float, operation, **kwargs) -> Any:
+    """Run a blocking Athena API call in the default executor until the deadline."""
+    remaining = deadline - time.monotonic()
+    if remaining <= 0:
+        raise TimeoutError()
+    loop = asyncio.get_running_loop()
+    return await asyncio.wait_for(
+        loop.run_in_executor(None, partial(operation, **kwargs)), remaining
+    )
+
+
+def _stop_query_execution(execution_id: str) -> None:
+    """Stop athena query, logging instead of raising on failure."""
+    try:
+        athena.stop_query_execution(QueryExecutionId=execution_id)
+    except Exception as e:
+        logger.warning(f"Failed to stop query {execution_id}: {e}")
+
+
+def _stop_started_query(start: asyncio.Future) -> None:
+    """Stop the query of a start call that returned after the deadline."""
+    if start.cancelled() or start.exception() is not None:
+        return
+    asyncio.get_running_loop().run_in_executor(
+        None, _stop_query_execution, start.result()["QueryExecutionId"]
+    )
+
+
 async def run_athena_query(
     query: str,
     database: str,
     workgroup: str,
     output_location: str,
     query_limit: int = QUERY_LIMIT,
+    initial_poll_interval: float = INITIAL_POLL_INTERVAL,
+    max_poll_interval: float = MAX_POLL_INTERVAL,
+    timeout: float = QUERY_TIMEOUT,
 ):
     """Run athena query."""
-    query_execution = athena.start_query_execution(
-        QueryString=query,
-        QueryExecutionContext={"Database": database},
-        WorkGroup=workgroup,
-        ResultConfiguration={
-            "OutputLocation": output_location,
-        },
+    loop = asyncio.get_running_loop()
+    deadline = time.monotonic() + timeout
+    # Keep hold of the start call: if the deadline passes before it returns,
+    # the query it starts still has to be stopped once its id is known.
+    start = loop.run_in_executor(
+        None,
+        partial(
+            athena.start_query_execution,
+            QueryString=query,
+            QueryExecutionContext={"Database": database},
+            WorkGroup=workgroup,
+            ResultConfiguration={
+                "OutputLocation": output_location,
+            },
+        ),
     )
-    execution_id = query_execution["QueryExecutionId"]
-    logger.debug(f"query_execution_id: {execution_id}")
-
-    # Wait until query completed
-    while True:
-        query_execution = athena.get_query_execution(QueryExecutionId=execution_id)
-        status = query_execution["QueryExecution"]["Status"]["State"]
-        logger.debug(f"status: {status}")
-        if status == "SUCCEEDED":
-            break
-        elif status == "FAILED":
-            reason = query_execution["QueryExecution"]["Status"]["StateChangeReason"]
-            logger.error(f"query failed.")
-            raise Exception(reason)
+    execution_id = None
+    try:
+        query_execution = await asyncio.wait_for(asyncio.shield(start), timeout)
+        execution_id = query_execution["QueryExecutionId"]
+        logger.debug(f"query_execution_id: {execution_id}")
+
+        # Wait until query completed
+        poll_interval = initial_poll_interval
+        while True:
+            query_execution = await _call_athena(
+                deadline, athena.get_query_execution, QueryExecutionId=execution_id
+            )
+            status = query_execution["QueryExecution"]["Status"]["State"]
+            logger.debug(f"status: {status}")
+            if status == "SUCCEEDED":
+                break
+            elif status in ("FAILED", "CANCELLED"):
+                reason = query_execution["QueryExecution"]["Status"].get(
+                    "StateChangeReason", status
+                )
+                logger.error(f"query {status.lower()}.")
+                raise Exception(reason)
+
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                raise TimeoutError()
+            await asyncio.sleep(min(poll_interval, remaining))
+            poll_interval = min(poll_interval * 2, max_poll_interval)
+
+        # Get query results
+        return await _call_athena(
+            deadline,
+            athena.get_query_results,
+            QueryExecutionId=execution_id,
+            MaxResults=query_limit,
+        )
+    except TimeoutError:
+        # Stop the query in the background so that the caller is not held
+        # past the deadline by the stop request.
+        if execution_id is not None:
+            loop.run_in_executor(None, _stop_query_execution, execution_id)
         else:
-            await asyncio.sleep(1)
-
-    # Get query results
-    results = athena.get_query_results(
-        QueryExecutionId=execution_id, MaxResults=query_limit
-    )
-    return results
+            start.add_done_callback(_stop_started_query)
+        raise TimeoutError(
+            f"Athena query did not complete within {timeout}s."
+        ) from None
 
 
 async def find_bots_sorted_by_price(
@@ -1,3 +1,6 @@
+from typing import Any
+
+import orjson
 from app.repositories.conversation import (
     change_conversation_title,
     delete_conversation_by_id,
@@ -29,8 +32,28 @@ from app.usecases.chat import (
 )
 from app.user import User
 from fastapi import APIRouter, Request
+from fastapi.responses import JSONResponse, ORJSONResponse
+
+
+# NOTE: ORJSONResponse is deprecated in newer FastAPI releases, which serialize
+# response models to JSON bytes through pydantic directly. Revisit this class
+# when the locked FastAPI version is upgraded past that deprecation.
+class _ConversationJSONResponse(ORJSONResponse):
+    """Render with orjson, falling back to the stdlib encoder for values orjson
+    rejects, such as integers wider than 64 bits in tool inputs and results."""
 
-router = APIRouter(tags=["conversation"])
+    def render(self, content: Any) -> bytes:
+        try:
+            return super().render(content)
+        except orjson.JSONEncodeError:
+            return JSONResponse.render(self, content)
+
+
+# Conversations can carry thousands of messages with base64 attachments,
+# so render responses with orjson rather than the stdlib json encoder.
+router = APIRouter(
+    tags=["conversation"], default_response_class=_ConversationJSONResponse
+)
 
 
 @router.get("/health")
@@ -601,15 +601,17 @@ def propose_conversation_title(
 def fetch_conversation(user_id: str, conversation_id: str) -> Conversation:
     conversation = find_conversation_by_id(user_id, conversation_id)
 
+    # The messages come from an already validated ConversationModel whose field
+    # types match the output schemas, so build them without revalidating each one.
     message_map = {
-        message_id: MessageOutput(
+        message_id: MessageOutput.model_construct(
             role=message.role,
             content=[c.to_content() for c in message.content],
             model=message.model,
             children=message.children,
             parent=message.parent,
             feedback=(
-                FeedbackOutput(
+                FeedbackOutput.model_construct(
                     thumbs_up=message.feedback.thumbs_up,
                     category=message.feedback.category,
                     comment=message.feedback.comment,
@@ -619,7 +621,7 @@ def fetch_conversation(user_id: str, conversation_id: str) -> Conversation:
             ),
             used_chunks=(
                 [
-                    Chunk(
+                    Chunk.model_construct(
                         content=c.content,
                         content_type=c.content_type,
                         source=c.source,
@@ -2,6 +2,7 @@ import json
 import logging
 import os
 from datetime import datetime
+from functools import lru_cache
 from typing import Any, Literal
 
 import boto3
@@ -61,6 +62,25 @@ def get_current_time():
     return int(datetime.now().timestamp() * 1000)
 
 
+@lru_cache(maxsize=1)
+def _get_s3_client():
+    # Shared by the S3 helpers below, which are called once per file when
+    # documents of a bot are added or removed.
+    return boto3.client("s3", region_name=BEDROCK_REGION)
+
+
+@lru_cache(maxsize=1)
+def _get_presign_s3_client():
+    # Shared across calls so that signing many URLs (e.g. one per related
+    # document) does not resolve credentials and build a client each time.
+    # See: https://github.com/boto/boto3/issues/421#issuecomment-1849066655
+    return boto3.client(
+        "s3",
+        region_name=BEDROCK_REGION,
+        config=Config(signature_version="v4", s3={"addressing_style": "path"}),
+    )
+
+
 def generate_presigned_url(
     bucket: str,
     key: str,
@@ -68,12 +88,7 @@ def generate_presigned_url(
     expiration=3600,
     client_method: Literal["put_object", "get_object"] = "put_object",
 ) -> str:
-    # See: https://github.com/boto/boto3/issues/421#issuecomment-1849066655
-    client = boto3.client(
-        "s3",
-        region_name=BEDROCK_REGION,
-        config=Config(signature_version="v4", s3={"addressing_style": "path"}),
-    )
+    client = _get_presign_s3_client()
     params = {"Bucket": bucket, "Key": key}
     if content_type:
         params["ContentType"] = content_type
@@ -107,7 +122,7 @@ def compose_upload_document_s3_path(user_id: str, bot_id: str, filename: str) ->
 
 
 def delete_file_from_s3(bucket: str, key: str, ignore_not_exist: bool = False):
-    client = boto3.client("s3", region_name=BEDROCK_REGION)
+    client = _get_s3_client()
 
     # Check if the file exists
     if not ignore_not_exist:
@@ -125,7 +140,7 @@ def delete_file_from_s3(bucket: str, key: str, ignore_not_exist: bool = False):
 
 def delete_files_with_prefix_from_s3(bucket: str, prefix: str):
     """Delete all objects with the given prefix from the given bucket."""
-    client = boto3.client("s3", region_name=BEDROCK_REGION)
+    client = _get_s3_client()
     response = client.list_objects_v2(Bucket=bucket, Prefix=prefix)
 
     if "Contents" not in response:
@@ -136,7 +151,7 @@ def delete_files_with_prefix_from_s3(bucket: str, prefix: str):
 
 
 def check_if_file_exists_in_s3(bucket: str, key: str):
-    client = boto3.client("s3", region_name=BEDROCK_REGION)
+    client = _get_s3_client()
 
     # Check if the file exists
     try:
@@ -151,7 +166,7 @@ def check_if_file_exists_in_s3(bucket: str, key: str):
 
 
 def move_file_in_s3(bucket: str, key: str, new_key: str):
-    client = boto3.client("s3", region_name=BEDROCK_REGION)
+    client = _get_s3_client()
 
     # Check if the file exists
     try:
@@ -346,7 +346,8 @@ def handler(event, context):
                     break
 
             logger.info(f"Number of message chunks: {len(message_parts)}")
-            message_parts.sort(key=lambda x: x["MessagePartId"])
+            # Query returns items in ascending MessagePartId (sort key) order,
+            # across pages too, so the parts are already in sequence.
             full_message = "".join(item["MessagePart"] for item in message_parts)
 
             # Process the concatenated full message
@@ -22,8 +22,11 @@ from app.repositories.models.conversation import (
     ChunkModel,
     FeedbackModel,
     ImageContentModel,
+    JsonToolResultModel,
     SimpleMessageModel,
     TextContentModel,
+    ToolResultContentModel,
+    ToolResultContentModelBody,
     ToolUseContentModel,
     ToolUseContentModelBody,
 )
@@ -316,9 +319,6 @@ class TestConversationRepository(unittest.TestCase):
         self.mock_table.put_item.return_value = {
             "ResponseMetadata": {"HTTPStatusCode": 200}
         }
-        self.mock_s3_client.put_object.return_value = {
-            "ResponseMetadata": {"HTTPStatusCode": 200}
-        }
 
         def mock_query_side_effect(**kwargs):
             if self.conversation_deleted:
@@ -388,6 +388,15 @@ class TestConversationRepository(unittest.TestCase):
         # Test storing large conversation
         response = store_conversation("user", large_conversation, threshold=1)
         self.assertIsNotNone(response)
+        self.mock_s3_client.put_object.assert_called_once()
+        self.mock_s3_client.upload_fileobj.assert_not_called()
+
+        # Message maps above the multipart threshold use the managed transfer
+        self.mock_s3_client.reset_mock()
+        with patch("app.repositories.conversation.THRESHOLD_MULTIPART_UPLOAD", 1):
+            store_conversation("user", large_conversation, threshold=1)
+        self.mock_s3_client.upload_fileobj.assert_called_once()
+        self.mock_s3_client.put_object.assert_not_called()
 
         # Test finding large conversation by id
         found_conversation = find_conversation_by_id(
@@ -425,6 +434,54 @@ class TestConversationRepository(unittest.TestCase):
         conversations = find_conversation_by_user_id(user_id="user")
         self.assertEqual(len(conversations), 0)
 
+    def test_store_conversation_with_large_integer_tool_result(self):
+        # Tool results are arbitrary JSON, so integers wider than 64 bits must
+        # survive the round trip through the stored message map.
+        large_integer = 2**64 + 1
+        conversation = ConversationModel(
+            id="3",
+            create_time=1627984879.9,
+            title="Large Integer Conversation",
+            total_price=0,
+            message_map={
+                "a": MessageModel(
+                    role="user",
+                    content=[
+                        ToolResultContentModel(
+                            content_type="toolResult",
+                            body=ToolResultContentModelBody(
+                                tool_use_id="xyz1234",
+                                content=[
+                                    JsonToolResultModel(json={"value": large_integer})
+                                ],
+                                status="success",
+                            ),
+                        )
+                    ],
+                    model="claude-v3-haiku",
+                    children=[],
+                    parent=None,
+                    create_time=1627984879.9,
+                    feedback=None,
+                    used_chunks=None,
+                    thinking_log=None,
+                )
+            },
+            last_message_id="a",
+            bot_id=None,
+            should_continue=False,
+        )
+        self.mock_table.put_item.return_value = {
+            "ResponseMetadata": {"HTTPStatusCode": 200}
+        }
+
+        store_conversation(user_id="user", conversation=conversation)
+
+        item = self.mock_table.put_item.call_args.kwargs["Item"]
+        message_map = json.loads(item["MessageMap"])
+        tool_result = message_map["a"]["content"][0]["body"]["content"][0]
+        self.assertEqual(tool_result["json"]["value"], large_integer)
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,62 @@
+import sys
+import unittest
+
+sys.path.insert(0, ".")
+
+from app.repositories.models.conversation import (
+    ImageGenerationRequestContentModel,
+    TextContentModel,
+    VideoGenerationResponseContentModel,
+    content_model_from_content,
+)
+from app.routes.schemas.conversation import (
+    ImageGenerationRequestContent,
+    ReasoningContent,
+    TextContent,
+    VideoGenerationResponseContent,
+)
+
+
+class TestContentModelFromContent(unittest.TestCase):
+    def test_text_content(self):
+        model = content_model_from_content(
+            TextContent(content_type="text", body="Hello")
+        )
+        self.assertIsInstance(model, TextContentModel)
+        self.assertEqual(model.body, "Hello")
+
+    def test_image_generation_request_content(self):
+        content = ImageGenerationRequestContent(
+            content_type="image_generation_request",
+            prompt="A lighthouse at dusk",
+            width=512,
+            height=512,
+        )
+        model = content_model_from_content(content)
+        self.assertIsInstance(model, ImageGenerationRequestContentModel)
+        self.assertEqual(model.to_content(), content)
+
+    def test_video_generation_response_content(self):
+        content = VideoGenerationResponseContent(
+            content_type="video_generation_response",
+            video_data=b"video",
+            prompt="Waves",
+            duration_seconds=6,
+        )
+        model = content_model_from_content(content)
+        self.assertIsInstance(model, VideoGenerationResponseContentModel)
+        self.assertEqual(model.to_content(), content)
+
+    def test_unsupported_content(self):
+        content = ReasoningContent(
+            content_type="reasoning",
+            text="Thinking",
+            signature="signature",
+            redacted_content=b"",
+        )
+        with self.assertRaises(ValueError):
+            content_model_from_content(content)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,5 +1,9 @@
+import asyncio
 import sys
+import threading
+import time
 import unittest
+from unittest.mock import MagicMock, patch
 
 sys.path.append(".")
 
@@ -10,6 +14,7 @@ from app.repositories.usage_analysis import (
     _find_cognito_users_by_ids,
     find_bots_sorted_by_price,
     find_users_sorted_by_price,
+    run_athena_query,
 )
 
 
@@ -42,5 +47,139 @@ class TestCognitoUser(unittest.IsolatedAsyncioTestCase):
         pprint(users)
 
 
+class FakeClock:
+    """Clock whose time only advances when the poller sleeps."""
+
+    def __init__(self):
+        self.now = 0.0
+        self.sleeps: list[float] = []
+
+    def monotonic(self) -> float:
+        return self.now
+
+    async def sleep(self, delay: float) -> None:
+        self.sleeps.append(delay)
+        self.now += delay
+
+
+def _execution(state: str, reason: str | None = None) -> dict:
+    status = {"State": state}
+    if reason is not None:
+        status["StateChangeReason"] = reason
+    return {"QueryExecution": {"Status": status}}
+
+
+class TestRunAthenaQuery(unittest.IsolatedAsyncioTestCase):
+    def setUp(self):
+        self.athena = MagicMock()
+        self.athena.start_query_execution.return_value = {"QueryExecutionId": "q1"}
+        self.clock = FakeClock()
+        patchers = [
+            patch("app.repositories.usage_analysis.athena", self.athena),
+            patch("app.repositories.usage_analysis.time", self.clock),
+            patch("app.repositories.usage_analysis.asyncio.sleep", self.clock.sleep),
+        ]
+        for patcher in patchers:
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+    async def _run(self, **kwargs):
+        return await run_athena_query(
+            "SELECT 1", "database", "workgroup", "s3://output", **kwargs
+        )
+
+    async def test_succeeded_with_backoff(self):
+        self.athena.get_query_execution.side_effect = [
+            _execution("RUNNING") for _ in range(6)
+        ] + [_execution("SUCCEEDED")]
+        self.athena.get_query_results.return_value = {"ResultSet": {}}
+
+        results = await self._run(timeout=60)
+
+        self.assertEqual(results, {"ResultSet": {}})
+        self.assertEqual(self.clock.sleeps, [0.5, 1.0, 2.0, 4.0, 5.0, 5.0])
+        self.athena.get_query_results.assert_called_once_with(
+            QueryExecutionId="q1", MaxResults=1000
+        )
+        self.athena.stop_query_execution.assert_not_called()
+
+    async def test_cancelled(self):
+        self.athena.get_query_execution.return_value = _execution(
+            "CANCELLED", "Query was cancelled by user"
+        )
+
+        with self.assertRaisesRegex(Exception, "Query was cancelled by user"):
+            await self._run()
+        self.athena.get_query_results.assert_not_called()
+
+    async def test_failed_without_reason(self):
+        self.athena.get_query_execution.return_value = _execution("FAILED")
+
+        with self.assertRaisesRegex(Exception, "^FAILED$"):
+            await self._run()
+
+    async def test_timeout_stops_query(self):
+        stopped = threading.Event()
+        self.athena.get_query_execution.return_value = _execution("RUNNING")
+        self.athena.stop_query_execution.side_effect = lambda **_: stopped.set()
+
+        with self.assertRaises(TimeoutError):
+            await self._run(timeout=3)
+
+        # The last sleep is cut short so that polling ends at the deadline.
+        self.assertEqual(self.clock.sleeps, [0.5, 1.0, 1.5])
+        self.assertEqual(self.clock.now, 3)
+        self.assertTrue(stopped.wait(5))
+        self.athena.stop_query_execution.assert_called_once_with(QueryExecutionId="q1")
+        self.athena.get_query_results.assert_not_called()
+
+
+class TestRunAthenaQueryDeadline(unittest.IsolatedAsyncioTestCase):
+    async def test_deadline_bounds_blocking_call(self):
+        stopped = threading.Event()
+        athena = MagicMock()
+        athena.start_query_execution.return_value = {"QueryExecutionId": "q1"}
+        athena.get_query_execution.side_effect = lambda **_: time.sleep(1)
+        athena.stop_query_execution.side_effect = lambda **_: stopped.set()
+
+        with patch("app.repositories.usage_analysis.athena", athena):
+            started = time.monotonic()
+            with self.assertRaises(TimeoutError):
+                await run_athena_query(
+                    "SELECT 1", "database", "workgroup", "s3://output", timeout=0.2
+                )
+            elapsed = time.monotonic() - started
+            self.assertTrue(stopped.wait(5))
+
+        self.assertLess(elapsed, 1)
+        athena.stop_query_execution.assert_called_once_with(QueryExecutionId="q1")
+
+    async def test_deadline_stops_query_started_after_it(self):
+        stopped = threading.Event()
+
+        def start_query_execution(**_):
+            time.sleep(1)
+            return {"QueryExecutionId": "q1"}
+
+        athena = MagicMock()
+        athena.start_query_execution.side_effect = start_query_execution
+        athena.stop_query_execution.side_effect = lambda **_: stopped.set()
+
+        with patch("app.repositories.usage_analysis.athena", athena):
+            started = time.monotonic()
+            with self.assertRaises(TimeoutError):
+                await run_athena_query(
+                    "SELECT 1", "database", "workgroup", "s3://output", timeout=0.2
+                )
+            elapsed = time.monotonic() - started
+            # The stop is scheduled from the event loop once the start call
+            # returns, so keep the loop running while waiting for it.
+            self.assertTrue(await asyncio.to_thread(stopped.wait, 5))
+
+        self.assertLess(elapsed, 1)
+        athena.get_query_execution.assert_not_called()
+        athena.stop_query_execution.assert_called_once_with(QueryExecutionId="q1")
+
+
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,23 @@
+import json
+import sys
+import unittest
+
+sys.path.append(".")
+
+from app.routes.conversation import _ConversationJSONResponse
+
+
+class TestConversationJSONResponse(unittest.TestCase):
+    def test_render(self):
+        response = _ConversationJSONResponse({"value": 1, "text": "Hello"})
+        self.assertEqual(json.loads(response.body), {"value": 1, "text": "Hello"})
+
+    def test_render_integer_wider_than_64_bits(self):
+        # orjson rejects this, so the response falls back to the stdlib encoder.
+        large_integer = 2**64 + 1
+        response = _ConversationJSONResponse({"json": {"value": large_integer}})
+        self.assertEqual(json.loads(response.body), {"json": {"value": large_integer}})
+
+
+if __name__ == "__main__":
+    unittest.main()